@@ -1,8 +1,25 @@
+import asyncio
+import functools
+import logging
+import operator
+import re
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
-from client import RestClient
+from cachetools import TTLCache
+
+from client import AsyncRestClient, RestClient, parse_body
+
+if TYPE_CHECKING:
+    import pyarrow
+
+logger = logging.getLogger(__name__)
 
 
 class Network(Enum):
@@ -35,16 +52,26 @@ class Network(Enum):
     FANTOM_MAINNET = 250
     FANTOM_TESTNET = 4002
 
+    def __init__(self, value: int) -> None:
+        # The string of a chain id is built once, as members never change
+        self._str_cache = str(value)
+
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def from_str(network: str) -> 'Network':
-        network = network.lower()
-        for name, member in Network.__members__.items():
-            if network == name.lower() or network == str(member.value):
-                return member
-        raise ValueError(f'Unexpected value for describing network: {network}')
+        try:
+            return _NETWORK_BY_KEY[network.lower()]
+        except KeyError:
+            raise ValueError(f'Unexpected value for describing network: {network}') from None
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._str_cache
+
+
+# Networks by lowercase name and by chain id
+_NETWORK_BY_KEY: dict[str, Network] = {
+    key: member for name, member in Network.__members__.items() for key in (name.lower(), str(member.value))
+}
 
 
 class TestLevel(Enum):
@@ -56,11 +83,15 @@ class TestLevel(Enum):
     ALL = 'all'
 
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def from_str(level: str) -> 'TestLevel':
-        return TestLevel(level.lower())
+        try:
+            return cast('TestLevel', TestLevel._value2member_map_[level.lower()])
+        except KeyError:
+            raise ValueError(f'{level!r} is not a valid TestLevel') from None
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
 
 class Permission(Enum):
@@ -70,67 +101,247 @@ class Permission(Enum):
 
     @staticmethod
     def from_str(permission: str) -> 'Permission':
-        return Permission(permission)
+        try:
+            return cast('Permission', Permission._value2member_map_[permission])
+        except KeyError:
+            raise ValueError(f'{permission!r} is not a valid Permission') from None
 
     def __str__(self) -> str:
-        return str(self.value)
+        return self._value_
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenInfo:
     id: str
     name: str
     address: str
     symbol: str
-    decimals: str
-    total_supply: str
+    decimals: int
+    total_supply: int
     network: str
 
-    @staticmethod
-    def from_dict(data_dict: dict[str, str]) -> 'TokenInfo':
-        required_attributes = ['id', 'name', 'address', 'symbol', 'decimals', 'totalSupply', 'network']
+    _GETTER = operator.itemgetter('id', 'name', 'address', 'symbol', 'decimals', 'totalSupply', 'network')
+
+    @classmethod
+    def from_dict(cls, data_dict: dict[str, Any]) -> 'TokenInfo':
         try:
-            for attribute in required_attributes:
-                if attribute not in data_dict:
-                    raise KeyError(f'Missing attribute: {attribute}')
-
-            return TokenInfo(
-                data_dict['id'],
-                data_dict['name'],
-                data_dict['address'],
-                data_dict['symbol'],
-                data_dict['decimals'],
-                data_dict['totalSupply'],
-                data_dict['network'],
-            )
+            token_id, name, address, symbol, decimals, total_supply, network = cls._GETTER(data_dict)
         except KeyError as e:
-            raise KeyError(f'Invalid dictionary: {e}') from e
+            raise KeyError(f'Missing attribute: {e.args[0]}') from e
+        return cls(token_id, name, address, symbol, int(decimals), int(total_supply), network)
 
+    @classmethod
+    def from_list(cls, dicts: Iterable[dict[str, Any]]) -> list['TokenInfo']:
+        getter = cls._GETTER
+        try:
+            rows = [getter(data_dict) for data_dict in dicts]
+        except KeyError as e:
+            raise KeyError(f'Missing attribute: {e.args[0]}') from e
+        return [
+            cls(token_id, name, address, symbol, int(decimals), int(total_supply), network)
+            for token_id, name, address, symbol, decimals, total_supply, network in rows
+        ]
 
-class OpenAPI:
-    def __init__(self) -> None:
-        self.client = RestClient.from_config()
+    @classmethod
+    def to_arrow(cls, dicts: Iterable[dict[str, Any]]) -> 'pyarrow.Table':
+        """
+        Build a table with one column per attribute from a list of token dictionaries.
+        Requires the optional `pyarrow` package.
+        """
+        import pyarrow
 
-    def _get_generic(self, endpoint: str, message: str, parameters: dict[str, str] | None = None) -> Any:
+        getter = cls._GETTER
         try:
-            return self.client.get_data(endpoint, parameters)
-        except Exception as e:
-            print(message)
-            print(e)
+            columns = list(zip(*(getter(data_dict) for data_dict in dicts))) or [()] * 7
+        except KeyError as e:
+            raise KeyError(f'Missing attribute: {e.args[0]}') from e
+        token_ids, names, addresses, symbols, decimals, total_supplies, networks = columns
+        # The types are fixed, so that an empty list gives the same schema as any other
+        schema = pyarrow.schema(
+            [
+                ('id', pyarrow.string()),
+                ('name', pyarrow.string()),
+                ('address', pyarrow.string()),
+                ('symbol', pyarrow.string()),
+                ('decimals', pyarrow.uint8()),
+                # Supplies are uint256 values with up to 78 digits, beyond any Arrow integer or decimal type
+                ('total_supply', pyarrow.string()),
+                ('network', pyarrow.string()),
+            ]
+        )
+        return pyarrow.table(
+            {
+                'id': list(token_ids),
+                'name': list(names),
+                'address': list(addresses),
+                'symbol': list(symbols),
+                'decimals': [int(d) for d in decimals],
+                'total_supply': [str(int(t)) for t in total_supplies],
+                'network': [str(n) for n in networks],
+            },
+            schema=schema,
+        )
 
-    def _post_generic(self, endpoint: str, message: str, data: dict | None) -> Any:
-        try:
-            return self.client.post_data(endpoint, data=data)
-        except Exception as e:
-            print(message)
-            print(e)
 
-    def _delete_generic(self, endpoint: str, message: str, data: dict | None) -> Any:
-        try:
-            return self.client.delete_data(endpoint, data=data)
-        except Exception as e:
-            print(message)
-            print(e)
+# Token addresses are 20 bytes written in hexadecimal
+_ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+
+def _check_address(address: str) -> None:
+    if not _ADDRESS_RE.fullmatch(address):
+        raise ValueError(f'Invalid token address: {address}')
+
+
+def _token_endpoint(network: str, address: str) -> str:
+    the_network: Network = Network.from_str(network)
+    _check_address(address)
+    return 'tokens/' + str(the_network) + '/' + address
+
+
+def _token_list_id(result: dict[str, Any]) -> str:
+    try:
+        return result['id']
+    except KeyError:
+        raise KeyError('No id in the object returned when creating a list') from None
+
+
+@overload
+def _get_endpoint(name: str, end_point: str, doc: str, cache: str | None = None) -> Callable[['_OpenAPIBase'], Any]: ...
+
+
+@overload
+def _get_endpoint(
+    name: str, end_point: str, doc: str, cache: str | None = None, *, of_list: Literal[True]
+) -> Callable[['_OpenAPIBase', str], Any]: ...
+
+
+def _get_endpoint(
+    name: str, end_point: str, doc: str, cache: str | None = None, *, of_list: bool = False
+) -> Callable[..., Any]:
+    """
+    Build the API method `name` sending a GET request to a fixed endpoint,
+    or to an endpoint under a token list given by its id if `of_list`,
+    with its response cached in the attribute named `cache` if any.
+    The body is compiled from source so that it sends the request in a single call.
+    """
+    if of_list:
+        parameters = 'self, list_id'
+        path = "'token-lists/' + list_id + " + repr(end_point) if end_point else "'token-lists/' + list_id"
+    else:
+        parameters = 'self'
+        path = repr(end_point)
+    source = (
+        f'def {name}({parameters}):\n'
+        f"    return self._send('GET', {path}, None, None, {'self.' + cache if cache else 'None'})\n"
+    )
+    namespace: dict[str, Any] = {'__name__': __name__}
+    exec(source, namespace)
+    method = namespace[name]
+    method.__qualname__ = '_OpenAPIBase.' + name
+    method.__doc__ = doc
+    return method
+
+
+class Batch:
+    """
+    Calls to `OpenAPI` methods recorded while its batch mode is active.
+    Recorded calls return None; their results are obtained from `execute`,
+    which raises the exception of the first failed call if any.
+    The calls are sent concurrently and in no particular order, writes as well as reads,
+    so calls that depend on each other must not be recorded in the same batch.
+    """
+
+    def __init__(self, api: 'OpenAPI') -> None:
+        self.api = api
+        self.calls: list[tuple[str, str, dict | None, Callable[[Any], Any] | None, TTLCache | None]] = []
+
+    def execute(self, max_workers: int = 10) -> list[Any]:
+        """
+        Send the recorded calls concurrently over the pooled connections of the client.
+        Returns the results in the order the calls were recorded.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda call: self.api._execute(*call), self.calls))
+
+
+# Batch recording calls in the current context, kept per thread and asyncio task
+_active_batch: ContextVar[Batch | None] = ContextVar('_active_batch', default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedResponse:
+    # Undecoded body and ETag of the response
+    response: tuple[bytes, str | None]
+    # Count of writes made before the request, after which the response is revalidated
+    writes: int
+
+
+class _OpenAPICore:
+    """
+    State and request plumbing shared by `OpenAPI` and `AsyncOpenAPI`.
+    """
+
+    __slots__ = (
+        'client',
+        '_cache',
+        '_property_tests_cache',
+        '_bookmarked_tokens_count_cache',
+        '_cache_lock',
+        '_writes',
+    )
+
+    # Sends a request given by its method, endpoint, payload, conversion of the result and cache,
+    # and returns the result, or an awaitable of the result for `AsyncOpenAPI`
+    _send: Callable[..., Any]
+
+    def __init__(self) -> None:
+        # Responses of read-only requests, revalidated with their ETag once a write succeeds.
+        # This is the only response cache: the clients always go to the network.
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._property_tests_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        self._bookmarked_tokens_count_cache: TTLCache = TTLCache(maxsize=1, ttl=10)
+        self._cache_lock = threading.Lock()
+        self._writes = 0
+
+    def _lookup(self, cache: TTLCache, key: tuple) -> tuple[_CachedResponse | None, int]:
+        """
+        Get the cached response to a request if any, and the count of writes made so far.
+        """
+        with self._cache_lock:
+            return cache.get(key), self._writes
+
+    def _store(self, cache: TTLCache, key: tuple, cached: _CachedResponse) -> None:
+        with self._cache_lock:
+            cache[key] = cached
+
+    def _invalidate(self) -> None:
+        # The responses cached so far may have been changed by a write
+        with self._cache_lock:
+            self._writes += 1
+
+    def _get_generic(
+        self,
+        endpoint: str,
+        parameters: dict[str, str] | None = None,
+        convert: Callable[[Any], Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> Any:
+        return self._send('GET', endpoint, parameters, convert, cache)
+
+    def _post_generic(self, endpoint: str, data: dict | None, convert: Callable[[Any], Any] | None = None) -> Any:
+        return self._send('POST', endpoint, data, convert)
+
+    def _delete_generic(self, endpoint: str, data: dict | None) -> Any:
+        return self._send('DELETE', endpoint, data)
+
+
+class _OpenAPIBase(_OpenAPICore):
+    """
+    Methods of the ERCx API shared by `OpenAPI` and `AsyncOpenAPI`.
+    Each method builds its request and hands it to `_send`.
+    """
+
+    __slots__ = ()
 
     """
     Tokens and their Evaluations
@@ -140,44 +351,30 @@ class OpenAPI:
         """
         Get the information on a token from its network and address.
         """
-        the_network: Network = Network.from_str(network)
-        end_point = f'tokens/{the_network}/{address}'
-        message = (
-            f'An error occurred when retrieving info of token '
-            f'on network {network}({the_network}) at address {address}'
-        )
-        data_dict = self._get_generic(end_point, message)
-        return TokenInfo.from_dict(data_dict)
+        end_point = _token_endpoint(network, address)
+        return self._get_generic(end_point, convert=TokenInfo.from_dict, cache=self._cache)
 
     def get_token_report(self, network: str, address: str) -> Any:
         """
         Get the latest report on a token from its network and address.
         """
-        the_network: Network = Network.from_str(network)
-        end_point = f'tokens/{the_network}/{address}/report'
-        message = (
-            f'An error occurred when retrieving report of token'
-            f' on network {network} ({the_network}) at address {address}'
-        )
+        end_point = _token_endpoint(network, address) + '/report'
         parameters: dict[str, str] = {'fields': 'text,json,evaluations'}
-        return self._get_generic(endpoint=end_point, message=message, parameters=parameters)
+        return self._get_generic(endpoint=end_point, parameters=parameters, cache=self._cache)
 
     def get_token_evaluations(self, network: str, address: str, level: str, standard: int | None = None) -> Any:
         """
         Get the latest evaluations of a token by test level from its network and address.
         """
         the_network: Network = Network.from_str(network)
+        _check_address(address)
         the_level = TestLevel.from_str(level)
-        end_point = f'tokens/{the_network}/{address}/levels/{str(the_level)}'
-        message = (
-            f'An error occurred when retrieving evaluations'
-            f' of level {str(the_level)} for token on network {network} ({the_network}) at address {address}'
-        )
+        end_point = 'tokens/' + str(the_network) + '/' + address + '/levels/' + the_level.value
         if standard:
             parameters = {'standard': f'ERC{standard}'}
-            return self._get_generic(end_point, message, parameters)
+            return self._get_generic(end_point, parameters)
         else:
-            return self._get_generic(end_point, message)
+            return self._get_generic(end_point)
 
     def get_token_test_evaluation(self, network: str, address: str, name: str, standard: int | None = None) -> Any:
         """
@@ -185,16 +382,13 @@ class OpenAPI:
         The list of tests is available at https://ercx.runtimeverification.com/whats-being-tested.
         """
         the_network: Network = Network.from_str(network)
-        end_point = f'tokens/{the_network}/{address}/tests/{name}'
-        message = (
-            f'An error occurred when retrieving evaluations for ERC-{standard}'
-            f' of test {name} for token on network {network} ({the_network}) at address {address}'
-        )
+        _check_address(address)
+        end_point = 'tokens/' + str(the_network) + '/' + address + '/tests/' + name
         if standard:
             parameters = {'standard': f'ERC{standard}'}
-            return self._get_generic(end_point, message, parameters)
+            return self._get_generic(end_point, parameters)
         else:
-            return self._get_generic(end_point, message)
+            return self._get_generic(end_point)
 
     """
     Property Tests
@@ -207,94 +401,51 @@ class OpenAPI:
         params = {'standard': 'ERC20'}
         if level != '':
             the_level = TestLevel.from_str(level)
-            params['level'] = str(the_level)
+            params['level'] = the_level.value
         end_point = 'property-tests'
-        message = f'An error occurred when retrieving property tests of level {level}'
-        return self._get_generic(end_point, message, parameters=params)
+        return self._get_generic(end_point, parameters=params, cache=self._property_tests_cache)
 
     """
     Users
     """
 
-    def get_my_info(self) -> Any:
-        """
-        Get the information about the logged-in user.
-        """
-        end_point = 'user'
-        message = 'An error occurred when retrieving information about the logged-in user.'
-        return self._get_generic(end_point, message)
-
-    def get_my_token_lists(self) -> Any:
-        """
-        Get the token lists of the authenticated user.
-        """
-        end_point = 'user/token-lists'
-        message = 'An error occurred when retrieving the token lists you own.'
-        return self._get_generic(end_point, message)
-
-    def get_shared_token_lists(self) -> Any:
-        """
-        Get the token lists shared with the authenticated user.
-        """
-        end_point = 'user/shared-token-lists'
-        message = 'An error occurred when retrieving the token lists shared with you.'
-        return self._get_generic(end_point, message)
-
-    def get_bookmarked_tokens(self) -> Any:
-        """
-        Get the bookmarked tokens of the authenticated user.
-        """
-        end_point = 'user/bookmarked-tokens'
-        message = 'An error occurred when retrieving your bookmarked tokens.'
-        return self._get_generic(end_point, message)
-
-    def get_bookmarked_tokens_count(self) -> Any:
-        """
-        Get the bookmarked tokens of the authenticated user.
-        """
-        end_point = 'user/bookmarked-tokens-count'
-        message = 'An error occurred when retrieving your bookmarked tokens count.'
-        return self._get_generic(end_point, message)
+    get_my_info = _get_endpoint('get_my_info', 'user', 'Get the information about the logged-in user.', cache='_cache')
+    get_my_token_lists = _get_endpoint(
+        'get_my_token_lists', 'user/token-lists', 'Get the token lists of the authenticated user.'
+    )
+    get_shared_token_lists = _get_endpoint(
+        'get_shared_token_lists', 'user/shared-token-lists', 'Get the token lists shared with the authenticated user.'
+    )
+    get_bookmarked_tokens = _get_endpoint(
+        'get_bookmarked_tokens', 'user/bookmarked-tokens', 'Get the bookmarked tokens of the authenticated user.'
+    )
+    get_bookmarked_tokens_count = _get_endpoint(
+        'get_bookmarked_tokens_count',
+        'user/bookmarked-tokens-count',
+        'Get the count of bookmarked tokens of the authenticated user.',
+        cache='_bookmarked_tokens_count_cache',
+    )
 
     """
     Token Lists
     """
 
-    def get_token_list_info(self, list_id: str) -> Any:
-        """
-        Get the information of a token list by its id.
-        """
-        # TODO: Validate the format of the list.
-        end_point = f'token-lists/{list_id}'
-        message = f'An error occurred when retrieving information about token list with id {list_id}.'
-        return self._get_generic(end_point, message)
-
-    def get_tokens_of_list(self, list_id: str) -> Any:
-        """
-        Get the tokens of a token list by its id.
-        """
-        # TODO: Validate the format of the list.
-        end_point = f'token-lists/{list_id}/tokens'
-        message = f'An error occurred when retrieving the tokens of token list with id {list_id}.'
-        return self._get_generic(end_point, message)
-
-    def get_users_of_list(self, list_id: str) -> Any:
-        """
-        Get the users of a token list by its id.
-        """
-        # TODO: Validate the format of the list.
-        end_point = f'token-lists/{list_id}/users'
-        message = f'An error occurred when retrieving the users of token list with id {list_id}.'
-        return self._get_generic(end_point, message)
-
-    def get_tokens_count_of_list(self, list_id: str) -> Any:
-        """
-        Get the count of tokens in a token list by its id.
-        """
-        # TODO: Validate the format of the list.
-        end_point = f'token-lists/{list_id}/tokens-count'
-        message = f'An error occurred when retrieving the users of token list with id {list_id}.'
-        return self._get_generic(end_point, message)
+    # TODO: Validate the format of the list.
+    get_token_list_info = _get_endpoint(
+        'get_token_list_info', '', 'Get the information of a token list by its id.', cache='_cache', of_list=True
+    )
+    # TODO: Validate the format of the list.
+    get_tokens_of_list = _get_endpoint(
+        'get_tokens_of_list', '/tokens', 'Get the tokens of a token list by its id.', of_list=True
+    )
+    # TODO: Validate the format of the list.
+    get_users_of_list = _get_endpoint(
+        'get_users_of_list', '/users', 'Get the users of a token list by its id.', of_list=True
+    )
+    # TODO: Validate the format of the list.
+    get_tokens_count_of_list = _get_endpoint(
+        'get_tokens_count_of_list', '/tokens-count', 'Get the count of tokens in a token list by its id.', of_list=True
+    )
 
     def create_token_list(self, name: str, description: str = '') -> str:
         """
@@ -302,14 +453,8 @@ class OpenAPI:
         Returns the id of the token list.
         """
         end_point = 'token-lists'
-        message = f'An error occurred when creating token list of name {name}.'
-        result = self._post_generic(end_point, message, {'name': name, 'description': description})
-        if result:
-            if 'id' in result:
-                return result['id']
-            else:
-                print('Error. No id in the object returned when creating a list')
-        return 'Error'
+        data = {'name': name, 'description': description}
+        return self._post_generic(end_point, data, convert=_token_list_id)
 
     def add_token_to_token_list(self, address: str, network: str, token_list: str) -> bool:
         """
@@ -317,26 +462,20 @@ class OpenAPI:
         Returns true if adding was successful.
         """
         the_network: Network = Network.from_str(network)
+        _check_address(address)
         end_point = f'token-lists/{token_list}/tokens'
-        message = (
-            f'An error occurred when adding a token at address {address}'
-            f' on network {the_network} to list of id {token_list}.'
-        )
-        result = self._post_generic(end_point, message, data={'address': address, 'network': the_network.value})
+        result = self._post_generic(end_point, data={'address': address, 'network': the_network.value})
         return result
 
     def remove_token_from_token_list(self, address: str, network: str, token_list: str) -> bool:
         """
-        Add a token to a token list.
-        Returns true if adding was successful.
+        Remove a token from a token list.
+        Returns true if removing was successful.
         """
         the_network: Network = Network.from_str(network)
+        _check_address(address)
         end_point = f'token-lists/{token_list}/tokens'
-        message = (
-            f'An error occurred when removing the token at address {address}'
-            f' on network {the_network} to list of id {token_list}.'
-        )
-        result = self._delete_generic(end_point, message, data={'address': address, 'network': the_network.value})
+        result = self._delete_generic(end_point, data={'address': address, 'network': the_network.value})
         return result
 
     def share_token_list_with_user(self, user_id: str, permission: str, token_list_id: str) -> Any:
@@ -345,11 +484,7 @@ class OpenAPI:
         """
         the_permission = Permission.from_str(permission)
         end_point = f'token-lists/{token_list_id}/users'
-        message = (
-            f'An error occurred when providing permission {str(the_permission)} '
-            f'to user of id {user_id} for list {token_list_id}'
-        )
-        result = self._post_generic(end_point, message, data={'userId': user_id, 'permission': the_permission.value})
+        result = self._post_generic(end_point, data={'userId': user_id, 'permission': the_permission.value})
         return result
 
     def unshare_token_list_with_user(self, user_id: str, token_list_id: str) -> Any:
@@ -357,11 +492,193 @@ class OpenAPI:
         Remove a user from a token list.
         """
         end_point = f'token-lists/{token_list_id}/users/{user_id}'
-        message = f'An error occurred when removing user of id {user_id} for list {token_list_id}'
-        result = self._delete_generic(end_point, message, None)
+        result = self._delete_generic(end_point, None)
         return result
 
 
+class OpenAPI(_OpenAPIBase):
+    __slots__ = ('_get', '_get_raw', '_post', '_delete')
+
+    def __init__(self, client: RestClient | None = None) -> None:
+        super().__init__()
+        self.client = client if client is not None else RestClient.from_config()
+        # Bind the client methods once to save a lookup per request
+        self._get = self.client.get_data
+        self._get_raw = self.client.get_raw
+        self._post = self.client.post_data
+        self._delete = self.client.delete_data
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def default(cls) -> 'OpenAPI':
+        """
+        Get an instance shared across the process, so that its connections stay warm.
+        """
+        return cls()
+
+    @contextmanager
+    def batch_mode(self) -> Iterator[Batch]:
+        """
+        Record the calls made on this instance within the block instead of sending them.
+        Only calls from the current thread or asyncio task are recorded.
+        The returned batch executes them concurrently, e.g.:
+
+            with api.batch_mode() as batch:
+                api.get_token_info(network, address)
+                api.get_token_report(network, address)
+            token_info, token_report = batch.execute()
+        """
+        batch = Batch(self)
+        token = _active_batch.set(batch)
+        try:
+            yield batch
+        finally:
+            _active_batch.reset(token)
+
+    def _execute(
+        self,
+        method: str,
+        endpoint: str,
+        payload: dict | None = None,
+        convert: Callable[[Any], Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> Any:
+        if method == 'POST':
+            result = self._post(endpoint, payload)
+            self._invalidate()
+        elif method == 'DELETE':
+            result = self._delete(endpoint, payload)
+            self._invalidate()
+        elif cache is None:
+            result = self._get(endpoint, payload)
+        else:
+            key = (endpoint, frozenset(payload.items()) if payload else frozenset())
+            cached, writes = self._lookup(cache, key)
+            if cached is None or cached.writes != writes:
+                response = self._get_raw(endpoint, payload, cached.response if cached else None)
+                cached = _CachedResponse(response, writes)
+                self._store(cache, key, cached)
+            # Decoding the cached body hands every caller a result of its own
+            result = parse_body(cached.response[0])
+        return convert(result) if convert else result
+
+    def _enqueue_or_execute(
+        self,
+        method: str,
+        endpoint: str,
+        payload: dict | None = None,
+        convert: Callable[[Any], Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> Any:
+        batch = _active_batch.get()
+        if batch is not None and batch.api is self:
+            batch.calls.append((method, endpoint, payload, convert, cache))
+            return None
+        return self._execute(method, endpoint, payload, convert, cache)
+
+    _send = _enqueue_or_execute
+
+
+if TYPE_CHECKING:
+
+    class _AsyncOpenAPIBase(_OpenAPICore):
+        # The methods of `_OpenAPIBase` as seen through `AsyncOpenAPI`, whose `_send` returns awaitables
+        async def get_token_info(self, network: str, address: str) -> TokenInfo: ...
+        async def get_token_report(self, network: str, address: str) -> Any: ...
+        async def get_token_evaluations(
+            self, network: str, address: str, level: str, standard: int | None = None
+        ) -> Any: ...
+        async def get_token_test_evaluation(
+            self, network: str, address: str, name: str, standard: int | None = None
+        ) -> Any: ...
+        async def get_property_tests(self, level: str = '') -> Any: ...
+        async def get_my_info(self) -> Any: ...
+        async def get_my_token_lists(self) -> Any: ...
+        async def get_shared_token_lists(self) -> Any: ...
+        async def get_bookmarked_tokens(self) -> Any: ...
+        async def get_bookmarked_tokens_count(self) -> Any: ...
+        async def get_token_list_info(self, list_id: str) -> Any: ...
+        async def get_tokens_of_list(self, list_id: str) -> Any: ...
+        async def get_users_of_list(self, list_id: str) -> Any: ...
+        async def get_tokens_count_of_list(self, list_id: str) -> Any: ...
+        async def create_token_list(self, name: str, description: str = '') -> str: ...
+        async def add_token_to_token_list(self, address: str, network: str, token_list: str) -> bool: ...
+        async def remove_token_from_token_list(self, address: str, network: str, token_list: str) -> bool: ...
+        async def share_token_list_with_user(self, user_id: str, permission: str, token_list_id: str) -> Any: ...
+        async def unshare_token_list_with_user(self, user_id: str, token_list_id: str) -> Any: ...
+
+else:
+    _AsyncOpenAPIBase = _OpenAPIBase
+
+
+class AsyncOpenAPI(_AsyncOpenAPIBase):
+    """
+    Asynchronous counterpart of `OpenAPI`, for issuing many independent requests concurrently.
+    It has the same methods, each returning an awaitable of the result.
+    Use it as an async context manager so that the underlying session is closed.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.client = AsyncRestClient.from_config()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def __aenter__(self) -> 'AsyncOpenAPI':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _execute(
+        self,
+        method: str,
+        endpoint: str,
+        payload: dict | None = None,
+        convert: Callable[[Any], Any] | None = None,
+        cache: TTLCache | None = None,
+    ) -> Any:
+        if method == 'POST':
+            result = await self.client.post_data(endpoint, payload)
+            self._invalidate()
+        elif method == 'DELETE':
+            result = await self.client.delete_data(endpoint, payload)
+            self._invalidate()
+        elif cache is None:
+            result = await self.client.get_data(endpoint, payload)
+        else:
+            key = (endpoint, frozenset(payload.items()) if payload else frozenset())
+            cached, writes = self._lookup(cache, key)
+            if cached is None or cached.writes != writes:
+                response = await self.client.get_raw(endpoint, payload, cached.response if cached else None)
+                cached = _CachedResponse(response, writes)
+                self._store(cache, key, cached)
+            # Decoding the cached body hands every caller a result of its own
+            result = parse_body(cached.response[0])
+        return convert(result) if convert else result
+
+    _send = _execute
+
+    async def get_many_token_infos(self, pairs: Iterable[tuple[str, str]]) -> list[TokenInfo]:
+        """
+        Get the information on several tokens, given as (network, address) pairs, concurrently.
+        """
+        end_points = [_token_endpoint(network, address) for network, address in pairs]
+        data_dicts = await asyncio.gather(
+            *(self._get_generic(end_point, cache=self._cache) for end_point in end_points)
+        )
+        return TokenInfo.from_list(data_dicts)
+
+    async def get_many_token_reports(self, pairs: Iterable[tuple[str, str]]) -> list[Any]:
+        """
+        Get the latest reports on several tokens, given as (network, address) pairs, concurrently.
+        """
+        return await asyncio.gather(*(self.get_token_report(network, address) for network, address in pairs))
+
+
 def example_get_requests(api: OpenAPI) -> None:
     # Get my info
     my_info = api.get_my_info()
@@ -429,7 +746,6 @@ def examples_post_requests(api: OpenAPI) -> str:
 
 def examples_delete_requests(api: OpenAPI, list_id: str) -> None:
     # Delete token from list
-    # Note the following displays an error message whereas the token is indeed deleted.
     success_delete = api.remove_token_from_token_list(tether_address, tether_network, list_id)
     print(success_delete)
     # Remove user from list
@@ -437,8 +753,19 @@ def examples_delete_requests(api: OpenAPI, list_id: str) -> None:
     print(success_remove)
 
 
+async def example_concurrent_get_requests() -> None:
+    async with AsyncOpenAPI() as api:
+        # Get the information and reports on several tokens at once
+        pairs = [(tether_network, tether_address), (the_network, tether_address)]
+        token_infos, token_reports = await asyncio.gather(
+            api.get_many_token_infos(pairs), api.get_many_token_reports(pairs)
+        )
+        print(token_infos)
+        print(token_reports)
+
+
 def launch_requests() -> None:
-    my_api = OpenAPI()
+    my_api = OpenAPI.default()
     # Launch get requests
     example_get_requests(my_api)
     # Launch post requests
@@ -455,7 +782,11 @@ some_other_user = '101185369'
 
 
 if __name__ == '__main__':
-    launch_requests()
-    api = OpenAPI()
-    info = api.get_token_info(tether_network, tether_address)
-    print(info)
+    try:
+        launch_requests()
+        api = OpenAPI.default()
+        info = api.get_token_info(tether_network, tether_address)
+        print(info)
+        asyncio.run(example_concurrent_get_requests())
+    except Exception:
+        logger.exception('An error occurred when running the examples.')
@@ -1,62 +1,127 @@
+import asyncio
 import configparser
+import functools
+import time
+from collections.abc import Callable
 from typing import Any
 
-import requests
+import aiohttp
+import httpx
+
+# Decoding of JSON response bodies, faster with the optional orjson
+_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+# Successful statuses, 304 answering a request made with the ETag of a cached response
+_SUCCESS_STATUSES = frozenset([200, 201, 204, 304])
+
+# Transient failures of GET requests, retried with an exponential backoff
+_RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.3
+
+# Seconds allowed for a request, as full reports can take long to produce
+_TIMEOUT = 300.0
+
+
+def parse_body(body: bytes) -> Any:
+    """
+    Parse the JSON body of a response, None if the body is empty.
+    """
+    return _loads(body) if body else None
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config() -> tuple[str, str]:
+    config = configparser.ConfigParser()
+    config.read('config.ini')
+    url = config['URLs']['ERCx_API_URL']
+    key = config['Keys']['ERCx_API_KEY']
+    return url, key
 
 
 class RestClient:
-    def __init__(self, api_url: str, api_key: str) -> None:
-        self.api_url = api_url
+    def __init__(self, api_url: str, api_key: str, transport: httpx.BaseTransport | None = None) -> None:
+        # Ensure a single separator between the base URL and the endpoints
+        self.api_url = api_url.rstrip('/') + '/'
         self.api_key = api_key
 
+        # Reuse and multiplex HTTP/2 connections across requests to the API host
+        if transport is None:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            transport = httpx.HTTPTransport(http2=True, limits=limits, retries=3)
+        # Ask for compressed responses, decoded transparently by httpx
+        headers = {'X-API-KEY': api_key, 'Accept-Encoding': 'gzip, deflate, br'}
+        self._client = httpx.Client(base_url=self.api_url, headers=headers, transport=transport, timeout=_TIMEOUT)
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> 'RestClient':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     @staticmethod
     def from_config() -> 'RestClient':
-        config = configparser.ConfigParser()
-        config.read('config.ini')
-        url = config['URLs']['ERCx_API_URL']
-        key = config['Keys']['ERCx_API_KEY']
+        url, key = _read_config()
         return RestClient(url, key)
 
-    def _send_request(
-        self, method: str, end_point: str, data: dict | None = None, parameters: dict | None = None
-    ) -> Any:
-        # Construct the headers with the API key
-        headers = {'X-API-KEY': self.api_key}
-
-        # Construct the URL
-        url = self.api_url + end_point
+    def _fetch(
+        self,
+        method: str,
+        end_point: str,
+        data: dict | None = None,
+        parameters: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes, str | None]:
+        if method not in ['GET', 'POST', 'DELETE']:
+            raise ValueError(f'Invalid method: {method}')
 
         try:
-            # Send the request based on the method (GET or POST)
+            # Send the request, relative to the base URL of the client
+            response = self._client.request(method, end_point, params=parameters, json=data or None, headers=headers)
+            # Retry GET requests on transient failures, which the transport does not retry
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=parameters)
-            elif method == 'POST':
-                if data:
-                    response = requests.post(url, headers=headers, json=data)
-                else:
-                    response = requests.post(url, headers=headers)
-            elif method == 'DELETE':
-                if data:
-                    response = requests.delete(url, headers=headers, json=data)
-                else:
-                    response = requests.delete(url, headers=headers)
-            else:
-                raise ValueError(f'Invalid method: {method}')
-
-        except requests.exceptions.RequestException as e:
+                for attempt in range(_RETRY_TOTAL):
+                    if response.status_code not in _RETRY_STATUSES:
+                        break
+                    time.sleep(_RETRY_BACKOFF_FACTOR * 2**attempt)
+                    response = self._client.request(method, end_point, params=parameters, headers=headers)
+        except httpx.HTTPError as e:
             # Handle any exceptions that may occur during the request
             raise Exception(f'Request error: {e}') from e
 
-        # Check if the request was successful (status code 200 or 201)
-        if response.status_code in [200, 201]:
-            # Parse the JSON response
-            response_data = response.json()
-
-            # Return the data
-            return response_data
+        # Check if the request was successful
+        if response.status_code in _SUCCESS_STATUSES:
+            return response.status_code, response.content, response.headers.get('ETag')
         else:
             # If the request was not successful, raise an exception
-            raise Exception(f'Request failed with status code {response.status_code}') from None
+            status = response.status_code
+            raise Exception(f'Request failed with status code {status}: {method} {response.url}') from None
+
+    def _send_request(
+        self, method: str, end_point: str, data: dict | None = None, parameters: dict | None = None
+    ) -> Any:
+        _, body, _ = self._fetch(method, end_point, data, parameters)
+        # Parse the JSON response, if there is any content
+        return parse_body(body)
+
+    def get_raw(
+        self, end_point: str, parameters: dict | None = None, cached: tuple[bytes, str | None] | None = None
+    ) -> tuple[bytes, str | None]:
+        """
+        Get the undecoded body of a response with its ETag.
+        Given the body and ETag of a cached response, it is returned as is if the resource still matches the ETag.
+        """
+        headers = {'If-None-Match': cached[1]} if cached and cached[1] else None
+        status, body, etag = self._fetch('GET', end_point, parameters=parameters, headers=headers)
+        return cached if status == 304 and cached else (body, etag)
 
     def get_data(self, end_point: str, parameters: dict | None = None) -> Any:
         return self._send_request('GET', end_point, parameters=parameters)
@@ -68,19 +133,119 @@ class RestClient:
         return self._send_request('DELETE', end_point, data=data)
 
 
+class AsyncRestClient:
+    def __init__(self, api_url: str, api_key: str, limit: int = 64) -> None:
+        # Ensure a single separator between the base URL and the endpoints
+        self.api_url = api_url.rstrip('/') + '/'
+        self.api_key = api_key
+        self.limit = limit
+        self._headers = {'X-API-KEY': api_key, 'Accept-Encoding': 'gzip, deflate, br'}
+
+        self._session: aiohttp.ClientSession | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    @staticmethod
+    def from_config() -> 'AsyncRestClient':
+        url, key = _read_config()
+        return AsyncRestClient(url, key)
+
+    def _get_session(self) -> tuple[aiohttp.ClientSession, asyncio.Semaphore]:
+        # The session and the semaphore are created lazily as they get bound to the running event loop
+        if self._session is None or self._semaphore is None:
+            connector = aiohttp.TCPConnector(limit_per_host=self.limit, keepalive_timeout=75)
+            timeout = aiohttp.ClientTimeout(total=_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self._headers, timeout=timeout)
+            # Bound the number of requests in flight when fanning out
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._session, self._semaphore
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+    async def __aenter__(self) -> 'AsyncRestClient':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _fetch(
+        self,
+        method: str,
+        end_point: str,
+        data: dict | None = None,
+        parameters: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes, str | None]:
+        if method not in ['GET', 'POST', 'DELETE']:
+            raise ValueError(f'Invalid method: {method}')
+
+        # Construct the URL
+        url = self.api_url + end_point
+        session, semaphore = self._get_session()
+
+        try:
+            async with semaphore:
+                for attempt in range(_RETRY_TOTAL + 1):
+                    request = session.request(method, url, params=parameters, json=data or None, headers=headers)
+                    async with request as response:
+                        status = response.status
+                        # Check if the request was successful
+                        if status in _SUCCESS_STATUSES:
+                            return status, await response.read(), response.headers.get('ETag')
+                    # Retry GET requests on transient failures, like the synchronous client
+                    if method != 'GET' or status not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                        break
+                    await asyncio.sleep(_RETRY_BACKOFF_FACTOR * 2**attempt)
+        except aiohttp.ClientError as e:
+            # Handle any exceptions that may occur during the request
+            raise Exception(f'Request error: {e}') from e
+
+        # If the request was not successful, raise an exception
+        raise Exception(f'Request failed with status code {status}: {method} {url}') from None
+
+    async def _send_request(
+        self, method: str, end_point: str, data: dict | None = None, parameters: dict | None = None
+    ) -> Any:
+        _, body, _ = await self._fetch(method, end_point, data, parameters)
+        # Parse the JSON response whatever the announced content type, if there is any content
+        return parse_body(body)
+
+    async def get_raw(
+        self, end_point: str, parameters: dict | None = None, cached: tuple[bytes, str | None] | None = None
+    ) -> tuple[bytes, str | None]:
+        """
+        Get the undecoded body of a response with its ETag.
+        Given the body and ETag of a cached response, it is returned as is if the resource still matches the ETag.
+        """
+        headers = {'If-None-Match': cached[1]} if cached and cached[1] else None
+        status, body, etag = await self._fetch('GET', end_point, parameters=parameters, headers=headers)
+        return cached if status == 304 and cached else (body, etag)
+
+    async def get_data(self, end_point: str, parameters: dict | None = None) -> Any:
+        return await self._send_request('GET', end_point, parameters=parameters)
+
+    async def post_data(self, end_point: str, data: dict | None = None) -> Any:
+        return await self._send_request('POST', end_point, data=data)
+
+    async def delete_data(self, end_point: str, data: dict | None = None) -> Any:
+        return await self._send_request('DELETE', end_point, data=data)
+
+
 # Example usage:
 if __name__ == '__main__':
     # Create an instance of the RestClient
-    client = RestClient.from_config()
+    with RestClient.from_config() as client:
+        the_end_point = 'tokens/1/0xdAC17F958D2ee523a2206206994597C13D831ec7'
 
-    the_end_point = 'tokens/1/0xdAC17F958D2ee523a2206206994597C13D831ec7'
-
-    try:
-        # Make a GET request and get the data
-        received_data = client.get_data(the_end_point, None)
-
-        # Now you can work with the data
-        print('Data received from the API:')
-        print(received_data)
-    except Exception as e:
-        print(f'An error occurred: {e}')
+        try:
+            # Make a GET request and get the data
+            received_data = client.get_data(the_end_point, None)
+
+            # Now you can work with the data
+            print('Data received from the API:')
+            print(received_data)
+        except Exception as e:
+            print(f'An error occurred: {e}')
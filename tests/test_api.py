@@ -0,0 +1,137 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import httpx
+import pytest
+
+import client
+from api import OpenAPI
+from client import RestClient
+
+API_URL = 'https://ercx.example/api/v1'
+TETHER_ADDRESS = '0xdAC17F958D2ee523a2206206994597C13D831ec7'
+TOKEN = {
+    'id': 'usdt',
+    'name': 'Tether USD',
+    'address': TETHER_ADDRESS,
+    'symbol': 'USDT',
+    'decimals': '6',
+    'totalSupply': '1000',
+    'network': '1',
+}
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def make_api(requests: list[httpx.Request]) -> Iterator[Callable[[Handler], OpenAPI]]:
+    clients: list[RestClient] = []
+
+    def make(handler: Handler) -> OpenAPI:
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        rest_client = RestClient(API_URL, 'key', transport=httpx.MockTransport(record))
+        clients.append(rest_client)
+        return OpenAPI(rest_client)
+
+    yield make
+    for rest_client in clients:
+        rest_client.close()
+
+
+def test_batch_returns_results_in_recording_order(make_api: Callable[[Handler], OpenAPI]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        list_id = request.url.path.split('/')[-2]
+        # The first recorded calls are answered last
+        time.sleep(0.05 / int(list_id))
+        return httpx.Response(200, json=[list_id])
+
+    api = make_api(handler)
+    with api.batch_mode() as batch:
+        for list_id in ['1', '2', '3', '4']:
+            assert api.get_tokens_of_list(list_id) is None
+    assert batch.execute(max_workers=4) == [['1'], ['2'], ['3'], ['4']]
+
+
+def test_batch_records_only_calls_of_its_thread(
+    make_api: Callable[[Handler], OpenAPI], requests: list[httpx.Request]
+) -> None:
+    api = make_api(lambda request: httpx.Response(200, json=[request.url.path]))
+    other_results = []
+    with api.batch_mode() as batch:
+        api.get_tokens_of_list('mine')
+        thread = threading.Thread(target=lambda: other_results.append(api.get_tokens_of_list('other')))
+        thread.start()
+        thread.join()
+        # The call of the other thread was sent right away
+        assert [request.url.path for request in requests] == ['/api/v1/token-lists/other/tokens']
+    assert other_results == [['/api/v1/token-lists/other/tokens']]
+    assert batch.execute() == [['/api/v1/token-lists/mine/tokens']]
+
+
+def test_write_invalidates_cached_responses(
+    make_api: Callable[[Handler], OpenAPI], requests: list[httpx.Request]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == 'POST':
+            return httpx.Response(201, json=True)
+        return httpx.Response(200, json=TOKEN)
+
+    api = make_api(handler)
+    first = api.get_token_info('mainnet', TETHER_ADDRESS)
+    assert api.get_token_info('mainnet', TETHER_ADDRESS) == first
+    assert len(requests) == 1
+
+    assert api.add_token_to_token_list(TETHER_ADDRESS, 'mainnet', 'list') is True
+    assert api.get_token_info('mainnet', TETHER_ADDRESS) == first
+    assert [request.method for request in requests] == ['GET', 'POST', 'GET']
+
+
+def test_cached_response_is_revalidated_with_its_etag(
+    make_api: Callable[[Handler], OpenAPI], requests: list[httpx.Request]
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={'id': 'me'}, headers={'ETag': '"v1"'})
+
+    api = make_api(handler)
+    api.get_my_info()['id'] = 'changed'
+    api.remove_token_from_token_list(TETHER_ADDRESS, 'mainnet', 'list')
+    # The cached body is decoded anew, so the caller's change is not seen
+    assert api.get_my_info() == {'id': 'me'}
+    assert [request.headers.get('If-None-Match') for request in requests] == [None, None, '"v1"']
+
+
+def test_get_is_retried_on_server_errors_then_raises(
+    make_api: Callable[[Handler], OpenAPI], requests: list[httpx.Request], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    delays: list[float] = []
+    monkeypatch.setattr(client.time, 'sleep', delays.append)
+    api = make_api(lambda request: httpx.Response(503))
+
+    with pytest.raises(Exception, match='status code 503'):
+        api.get_my_token_lists()
+    assert len(requests) == 4
+    assert delays == [0.3, 0.6, 1.2]
+
+
+def test_post_is_not_retried(
+    make_api: Callable[[Handler], OpenAPI], requests: list[httpx.Request], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(client.time, 'sleep', lambda delay: None)
+    api = make_api(lambda request: httpx.Response(503))
+
+    with pytest.raises(Exception, match='status code 503'):
+        api.create_token_list('list')
+    assert len(requests) == 1